@@ -2,10 +2,20 @@
 Advanced usage examples for TED Transcript Extractor.
 """
 
+import asyncio
 import logging
+import re
+import sys
+from itertools import islice
 from pathlib import Path
+
+try:
+    import aiohttp
+except ImportError:  # Optional; without it batches run on threads via extract_batch()
+    aiohttp = None
+
 from ted_extractor import TEDTranscriptExtractor
-from ted_extractor.utils import get_ted_urls_from_text, format_duration
+from ted_extractor.utils import get_ted_urls_from_text, format_duration, validate_ted_url
 
 
 def example_custom_extractor():
@@ -29,7 +39,7 @@ def example_custom_extractor():
         print(f"Extracted at: {talk.extracted_at}")
 
 
-def example_url_extraction():
+def example_url_extraction(extractor=None):
     """Example: Extract TED URLs from text content."""
     print("\n=== URL Extraction from Text ===")
     
@@ -52,14 +62,27 @@ def example_url_extraction():
     
     # Extract transcripts from found URLs
     if ted_urls:
-        extractor = TEDTranscriptExtractor(delay_between_requests=1.0)
+        extractor = extractor or TEDTranscriptExtractor(delay_between_requests=1.0)
         talks = extractor.extract_batch(ted_urls[:2])  # Limit to first 2 for demo
         
         successful = [talk for talk in talks if talk.success]
         print(f"\nSuccessfully extracted {len(successful)} transcripts")
 
 
-def example_file_processing():
+def iter_urls(path):
+    """Yield unique TED URLs from a file one line at a time, skipping blank lines and comments."""
+    seen = set()
+    with open(path, 'rb', buffering=1 << 20) as f:
+        for raw in f:
+            line = raw.strip()
+            if line.startswith(b'http'):
+                url = line.decode('utf-8')
+                if url not in seen and validate_ted_url(url):
+                    seen.add(url)
+                    yield url
+
+
+def example_file_processing(extractor=None):
     """Example: Process URLs from file and save results."""
     print("\n=== File Processing ===")
     
@@ -80,20 +103,15 @@ def example_file_processing():
     
     print(f"Created sample file: {urls_file}")
     
-    # Read and process URLs
-    valid_urls = []
-    with open(urls_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if line.startswith('http'):
-                    valid_urls.append(line)
-    
-    print(f"Found {len(valid_urls)} valid URLs in file")
+    # Stream URLs from the file straight into the extractor
+    extractor = extractor or TEDTranscriptExtractor()
+    urls = islice(iter_urls(urls_file), 1)  # Limit for demo
+    if aiohttp is not None:
+        talks = asyncio.run(extractor.extract_batch_async(urls))
+    else:
+        talks = extractor.extract_batch(urls)
     
-    # Extract transcripts
-    extractor = TEDTranscriptExtractor()
-    talks = extractor.extract_batch(valid_urls[:1])  # Limit for demo
+    print(f"Processed {len(talks)} URLs from file")
     
     # Save results in multiple formats
     if talks:
@@ -105,7 +123,7 @@ def example_file_processing():
     urls_file.unlink()
 
 
-def example_logging_configuration():
+def example_logging_configuration(extractor=None):
     """Example: Configure detailed logging."""
     print("\n=== Logging Configuration ===")
     
@@ -120,7 +138,7 @@ def example_logging_configuration():
     )
     
     # Create extractor
-    extractor = TEDTranscriptExtractor()
+    extractor = extractor or TEDTranscriptExtractor()
     
     # Extract with logging
     url = "https://www.ted.com/talks/brene_brown_the_power_of_vulnerability"
@@ -131,11 +149,11 @@ def example_logging_configuration():
         print("Check 'ted_extractor.log' for detailed logs")
 
 
-def example_transcript_segments():
+def example_transcript_segments(extractor=None):
     """Example: Work with transcript segments."""
     print("\n=== Transcript Segments ===")
     
-    extractor = TEDTranscriptExtractor()
+    extractor = extractor or TEDTranscriptExtractor()
     
     url = "https://www.ted.com/talks/brene_brown_the_power_of_vulnerability"
     talk = extractor.extract_single(url)
@@ -148,19 +166,27 @@ def example_transcript_segments():
         for i, segment in enumerate(talk.transcript_segments[:5]):
             print(f"  {i+1}. [{segment.start_time}s] {segment.text[:50]}...")
         
-        # Find segments with specific words
+        # Find segments with specific words (text_lower is computed once per segment)
         keyword = "vulnerability"
+        keyword_lower = keyword.lower()
         matching_segments = [
             seg for seg in talk.transcript_segments 
-            if keyword.lower() in seg.text.lower()
+            if keyword_lower in seg.text_lower
         ]
         
         print(f"\nFound {len(matching_segments)} segments containing '{keyword}':")
         for segment in matching_segments[:3]:  # Show first 3
             print(f"  [{segment.start_time}s] {segment.text}")
+        
+        # Search for several keywords at once with a single pattern
+        keywords = ["shame", "connection", "courage"]
+        pattern = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+        multi_matches = [seg for seg in talk.transcript_segments if pattern.search(seg.text)]
+        
+        print(f"\nFound {len(multi_matches)} segments mentioning any of {keywords}")
 
 
-def example_batch_with_progress():
+def example_batch_with_progress(extractor=None):
     """Example: Batch processing with detailed progress tracking."""
     print("\n=== Batch Processing with Progress ===")
     
@@ -169,28 +195,38 @@ def example_batch_with_progress():
         "https://www.ted.com/talks/simon_sinek_how_great_leaders_inspire_action"
     ]
     
-    # Custom progress callback
+    # Custom progress callback; each report is built up and written in one go
     def detailed_progress(current, total, talk):
-        print(f"\n[{current}/{total}] Processing: {talk.url}")
+        lines = [f"\n[{current}/{total}] Processing: {talk.url}"]
         
         if talk.success:
-            print(f"  SUCCESS: {talk.title}")
-            print(f"  Speaker: {talk.speaker}")
-            print(f"  Duration: {format_duration(talk.duration or 0)}")
-            print(f"  Views: {talk.views:,}" if talk.views else "  Views: Unknown")
-            print(f"  Transcript: {len(talk.transcript)} characters")
-            print(f"  Word count: {talk.get_word_count()}")
+            lines += [
+                f"  SUCCESS: {talk.title}",
+                f"  Speaker: {talk.speaker}",
+                f"  Duration: {format_duration(talk.duration or 0)}",
+                f"  Views: {talk.views:,}" if talk.views else "  Views: Unknown",
+                f"  Transcript: {len(talk.transcript)} characters",
+                f"  Word count: {talk.get_word_count()}",
+            ]
         else:
-            print(f"  FAILED: {talk.error_message}")
+            lines.append(f"  FAILED: {talk.error_message}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
-    # Extract with progress tracking
-    extractor = TEDTranscriptExtractor(delay_between_requests=1.0)
-    talks = extractor.extract_batch(urls, detailed_progress)
+    # Extract concurrently with progress tracking (async with aiohttp, else worker threads)
+    extractor = extractor or TEDTranscriptExtractor(delay_between_requests=1.0)
+    if aiohttp is not None:
+        talks = asyncio.run(extractor.extract_batch_async(urls, detailed_progress))
+    else:
+        talks = extractor.extract_batch(urls, detailed_progress)
     
     # Final summary
     successful = [talk for talk in talks if talk.success]
-    total_words = sum(talk.get_word_count() for talk in successful)
-    total_duration = sum(talk.duration or 0 for talk in successful)
+    total_words = total_duration = 0
+    for talk in successful:
+        total_words += talk.get_word_count()
+        total_duration += talk.duration or 0
     
     print(f"\n=== Final Summary ===")
     print(f"Total talks processed: {len(talks)}")
@@ -199,7 +235,7 @@ def example_batch_with_progress():
     print(f"Total duration: {format_duration(total_duration)}")
 
 
-def example_error_recovery():
+def example_error_recovery(extractor=None):
     """Example: Handle various error scenarios."""
     print("\n=== Error Recovery ===")
     
@@ -211,7 +247,7 @@ def example_error_recovery():
         "https://invalid-domain.com/talks/something",                        # Invalid domain
     ]
     
-    extractor = TEDTranscriptExtractor(max_retries=2)
+    extractor = extractor or TEDTranscriptExtractor(max_retries=2)
     
     def error_tracking_progress(current, total, talk):
         status = "SUCCESS" if talk.success else "FAILED"
@@ -239,9 +275,12 @@ def example_error_recovery():
 if __name__ == "__main__":
     # Run advanced examples
     example_custom_extractor()
-    example_url_extraction()
-    example_file_processing()
-    example_logging_configuration()
-    example_transcript_segments()
-    example_batch_with_progress()
-    example_error_recovery()
+    
+    # Share one extractor (and its pooled keep-alive connections) across the rest
+    with TEDTranscriptExtractor(delay_between_requests=1.0, max_retries=2) as extractor:
+        example_url_extraction(extractor)
+        example_file_processing(extractor)
+        example_logging_configuration(extractor)
+        example_transcript_segments(extractor)
+        example_batch_with_progress(extractor)
+        example_error_recovery(extractor)
@@ -2,15 +2,33 @@
 Basic usage examples for TED Transcript Extractor.
 """
 
+import asyncio
+import re
+from collections import Counter
+from pathlib import Path
+
+try:
+    import aiohttp
+except ImportError:  # Optional; without it batches run on threads via extract_batch()
+    aiohttp = None
+
 from ted_extractor import TEDTranscriptExtractor
 
+# Extracted talks are cached here, so examples that revisit the same talk
+# (and reruns of this script) don't hit the network again
+CACHE_DIR = Path.home() / ".cache" / "ted_extractor"
+
+# Words of four or more letters; lowercasing, punctuation stripping and the
+# length filter all happen in one regex pass
+_WORD_RE = re.compile(r"[a-z]{4,}")
+
 
 def example_single_extraction():
     """Example: Extract transcript from a single TED talk."""
     print("=== Single Talk Extraction ===")
     
     # Initialize extractor
-    extractor = TEDTranscriptExtractor()
+    extractor = TEDTranscriptExtractor(cache_dir=CACHE_DIR)
     
     # Extract transcript
     url = "https://www.ted.com/talks/brene_brown_the_power_of_vulnerability"
@@ -47,7 +65,8 @@ def example_batch_extraction():
     extractor = TEDTranscriptExtractor(
         delay_between_requests=1.0,  # Faster for demo
         timeout=30,
-        max_retries=2
+        max_retries=2,
+        cache_dir=CACHE_DIR
     )
     
     # Progress callback
@@ -55,8 +74,11 @@ def example_batch_extraction():
         status = "SUCCESS" if talk.success else "FAILED"
         print(f"[{current}/{total}] {status}: {talk.title or 'Unknown'}")
     
-    # Extract transcripts
-    talks = extractor.extract_batch(urls, progress_callback)
+    # Extract transcripts concurrently (async with aiohttp, else worker threads)
+    if aiohttp is not None:
+        talks = asyncio.run(extractor.extract_batch_async(urls, progress_callback))
+    else:
+        talks = extractor.extract_batch(urls, progress_callback)
     
     # Summary
     successful = [talk for talk in talks if talk.success]
@@ -73,7 +95,7 @@ def example_save_results():
     """Example: Save extraction results in different formats."""
     print("\n=== Save Results ===")
     
-    extractor = TEDTranscriptExtractor()
+    extractor = TEDTranscriptExtractor(cache_dir=CACHE_DIR)
     
     # Extract a talk
     url = "https://www.ted.com/talks/brene_brown_the_power_of_vulnerability"
@@ -97,7 +119,7 @@ def example_error_handling():
     """Example: Handle extraction errors gracefully."""
     print("\n=== Error Handling ===")
     
-    extractor = TEDTranscriptExtractor()
+    extractor = TEDTranscriptExtractor(cache_dir=CACHE_DIR)
     
     # Try invalid URL
     invalid_url = "https://www.ted.com/talks/nonexistent_talk"
@@ -120,7 +142,7 @@ def example_transcript_analysis():
     """Example: Analyze extracted transcript."""
     print("\n=== Transcript Analysis ===")
     
-    extractor = TEDTranscriptExtractor()
+    extractor = TEDTranscriptExtractor(cache_dir=CACHE_DIR)
     
     url = "https://www.ted.com/talks/brene_brown_the_power_of_vulnerability"
     talk = extractor.extract_single(url)
@@ -132,19 +154,18 @@ def example_transcript_analysis():
         
         # Basic statistics
         transcript = talk.get_clean_transcript()
-        words = transcript.split()
-        sentences = transcript.split('.')
+        word_count = talk.get_word_count()
+        sentence_count = transcript.count('.') + 1  # Same as len(transcript.split('.'))
         
         print(f"\nStatistics:")
         print(f"  Characters: {len(transcript):,}")
-        print(f"  Words: {len(words):,}")
-        print(f"  Sentences: {len(sentences):,}")
-        print(f"  Avg words per sentence: {len(words)/len(sentences):.1f}")
+        print(f"  Words: {word_count:,}")
+        print(f"  Sentences: {sentence_count:,}")
+        print(f"  Avg words per sentence: {word_count/sentence_count:.1f}")
         print(f"  Reading time: {talk.get_reading_time_minutes():.1f} minutes")
         
         # Word frequency (top 10)
-        from collections import Counter
-        word_freq = Counter(word.lower().strip('.,!?";') for word in words if len(word) > 3)
+        word_freq = Counter(_WORD_RE.findall(transcript.lower()))
         
         print(f"\nTop 10 words:")
         for word, count in word_freq.most_common(10):
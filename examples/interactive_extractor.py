@@ -3,33 +3,102 @@ Interactive TED Transcript Extractor
 交互式TED文字稿提取器
 """
 
+import asyncio
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import readline
+except ImportError:  # Windows 等平台没有 readline
+    readline = None
+
+try:
+    import aiohttp
+except ImportError:  # 可选依赖；未安装时批量提取改用线程（extract_batch）
+    aiohttp = None
+
 # Add the parent directory to Python path to import ted_extractor
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from ted_extractor import TEDTranscriptExtractor
 from ted_extractor.utils import validate_ted_url, format_duration
-import re
+
+# 文件名中不允许的字符及引号，一次 translate 全部移除
+_FNAME_TRANS = str.maketrans('', '', '<>:"/\\|?*\'')
+
+# 退出命令
+_QUIT_COMMANDS = frozenset(('quit', 'exit', 'q', '退出'))
+
+# 肯定回答
+_YES_ANSWERS = frozenset(('y', 'yes', '是'))
+
+# 命令历史文件
+HISTORY_FILE = Path.home() / ".ted_extractor_history"
 
 
 class InteractiveTEDExtractor:
     """交互式TED文字稿提取器"""
     
     def __init__(self):
-        self.extractor = TEDTranscriptExtractor(delay_between_requests=1.0)
+        self.extractor = TEDTranscriptExtractor(
+            delay_between_requests=1.0,
+            cache_dir=Path.home() / ".cache" / "ted_extractor"  # 缓存已提取的演讲，避免重复请求
+        )
         self.extracted_talks = []
+        # 后台保存线程池，文件写入不阻塞下一个请求
+        self._save_pool = ThreadPoolExecutor(max_workers=4)
+        # 命令别名 -> 处理方法，每条输入只需一次字典查找
+        self._commands = {
+            alias: handler
+            for aliases, handler in (
+                (('help', 'h', '帮助'), self.show_help),
+                (('history', '历史'), self.show_history),
+                (('save', '保存'), self.save_results_interactive),
+                (('batch', '批量'), self.batch_extract_interactive),
+                (('clear', '清空'), self.clear_history),
+            )
+            for alias in aliases
+        }
+        self._completions = sorted(set(self._commands) | set(_QUIT_COMMANDS))
+    
+    def _setup_readline(self):
+        """启用命令历史和 Tab 补全"""
+        if readline is None:
+            return
+        
+        readline.set_completer(self._complete_command)
+        if 'libedit' in (readline.__doc__ or ''):  # macOS 自带的 libedit
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+        readline.set_history_length(1000)
+        
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    def _save_readline_history(self):
+        """保存命令历史"""
+        if readline is None:
+            return
+        
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    def _complete_command(self, text, state):
+        """Tab 补全命令"""
+        matches = [command for command in self._completions if command.startswith(text)]
+        return matches[state] if state < len(matches) else None
     
     def clean_filename(self, title):
         """清理标题作为文件名"""
-        # 移除或替换不允许的字符
-        cleaned = re.sub(r'[<>:"/\\|?*]', '', title)
-        # 替换引号和其他特殊字符
-        cleaned = cleaned.replace('"', '').replace("'", '')
-        # 限制长度并去除首尾空格
-        cleaned = cleaned.strip()[:100]  # 限制文件名长度
+        # 移除不允许的字符，去除首尾空格并限制文件名长度
+        cleaned = title.translate(_FNAME_TRANS).strip()[:100]
         return cleaned if cleaned else "untitled"
         
     def show_welcome(self):
@@ -91,7 +160,7 @@ class InteractiveTEDExtractor:
         print()
         print("  保存结果:")
         print("    > save")
-        print("    选择格式 (1-3): 1")
+        print("    选择格式 (1-4): 1")
         print("    文件名: my_transcripts.json")
         print()
         print("【支持的URL格式】")
@@ -120,7 +189,7 @@ class InteractiveTEDExtractor:
             
             # 询问是否显示预览
             show_preview = input("\n是否显示文字稿预览? (y/n): ").lower().strip()
-            if show_preview in ['y', 'yes', '是']:
+            if show_preview in _YES_ANSWERS:
                 print(f"\n--- 文字稿预览 ---")
                 preview_text = talk.transcript[:500] + "..." if len(talk.transcript) > 500 else talk.transcript
                 print(preview_text)
@@ -143,14 +212,18 @@ class InteractiveTEDExtractor:
         print("-" * 50)
         
         urls = []
+        seen_urls = set()
         while True:
             url = input(f"URL {len(urls) + 1}: ").strip()
             
             if not url:  # 空行，结束输入
                 break
-                
-            if validate_ted_url(url):
+            
+            if url in seen_urls:  # 重复URL不会重复请求
+                print(f"  [提示] 已添加过，跳过: {url}")
+            elif validate_ted_url(url):
                 urls.append(url)
+                seen_urls.add(url)
                 print(f"  已添加: {url}")
             else:
                 print(f"  [警告] 无效的TED URL: {url}")
@@ -164,7 +237,7 @@ class InteractiveTEDExtractor:
         auto_save = input("是否为每个演讲自动保存单独的文件? (y/n): ").lower().strip()
         save_format = None
         
-        if auto_save in ['y', 'yes', '是']:
+        if auto_save in _YES_ANSWERS:
             print("\n选择保存格式:")
             print("  1. JSON - 包含完整数据")
             print("  2. CSV  - 表格格式")
@@ -183,6 +256,9 @@ class InteractiveTEDExtractor:
         
         print(f"\n开始批量提取 {len(urls)} 个演讲...")
         
+        pending_saves = []
+        used_filenames = set()
+        
         def progress_callback(current, total, talk):
             status = "成功" if talk.success else "失败"
             print(f"[{current}/{total}] {status}: {talk.title or '未知标题'}")
@@ -190,16 +266,28 @@ class InteractiveTEDExtractor:
             if not talk.success:
                 print(f"  错误: {talk.error_message}")
             elif save_format and talk.success:
-                # 自动保存单个文件
-                try:
-                    clean_title = self.clean_filename(talk.title)
-                    filename = f"{clean_title}.{save_format}"
-                    saved_file = self.extractor.save_results([talk], filename, save_format)
-                    print(f"  已保存: {saved_file}")
-                except Exception as e:
-                    print(f"  保存失败: {e}")
+                # 自动保存单个文件（在后台线程中写入）；同名标题加序号，避免并发写入同一文件
+                clean_title = self.clean_filename(talk.title)
+                filename = f"{clean_title}.{save_format}"
+                suffix = 2
+                while filename in used_filenames:
+                    filename = f"{clean_title}_{suffix}.{save_format}"
+                    suffix += 1
+                used_filenames.add(filename)
+                future = self._save_pool.submit(self.extractor.save_results, [talk], filename, save_format)
+                pending_saves.append((filename, future))
         
-        talks = self.extractor.extract_batch(urls, progress_callback)
+        if aiohttp is not None:
+            talks = asyncio.run(self.extractor.extract_batch_async(urls, progress_callback))
+        else:
+            talks = self.extractor.extract_batch(urls, progress_callback)
+        
+        # 等待后台保存完成
+        for filename, future in pending_saves:
+            try:
+                print(f"  已保存: {future.result()}")
+            except Exception as e:
+                print(f"  保存失败: {filename} - {e}")
         
         # 统计结果
         successful = [talk for talk in talks if talk.success]
@@ -211,16 +299,16 @@ class InteractiveTEDExtractor:
         print(f"  失败: {len(talks) - len(successful)}")
         
         if successful:
-            total_words = sum(talk.get_word_count() for talk in successful)
-            total_duration = sum(talk.duration or 0 for talk in successful)
+            total_words = total_duration = 0
+            for talk in successful:
+                total_words += talk.get_word_count()
+                total_duration += talk.duration or 0
             print(f"  总单词数: {total_words:,}")
             print(f"  总时长: {format_duration(total_duration)}")
             
             if save_format:
-                print(f"\n已自动保存 {len(successful)} 个文件:")
-                for talk in successful:
-                    clean_title = self.clean_filename(talk.title)
-                    filename = f"{clean_title}.{save_format}"
+                print(f"\n已自动保存 {len(pending_saves)} 个文件:")
+                for filename, _ in pending_saves:
                     print(f"  - {filename}")
     
     def show_history(self):
@@ -253,10 +341,11 @@ class InteractiveTEDExtractor:
         print("  1. JSON - 包含完整数据（推荐，包含所有元数据）")
         print("  2. CSV  - 表格格式（适合Excel打开）")
         print("  3. TXT  - 纯文本格式（仅包含文字稿内容）")
+        print("  4. JSONL - 每行一个演讲（适合大量演讲，始终保存为单个文件）")
         print()
         
-        format_choice = input("选择格式 (1-3): ").strip()
-        format_map = {'1': 'json', '2': 'csv', '3': 'txt'}
+        format_choice = input("选择格式 (1-4): ").strip()
+        format_map = {'1': 'json', '2': 'csv', '3': 'txt', '4': 'jsonl'}
         
         if format_choice not in format_map:
             print("无效选择")
@@ -264,8 +353,8 @@ class InteractiveTEDExtractor:
         
         format_type = format_map[format_choice]
         
-        # 如果有多个演讲，询问保存方式
-        if len(self.extracted_talks) > 1:
+        # 如果有多个演讲，询问保存方式（JSONL 始终合并保存）
+        if len(self.extracted_talks) > 1 and format_type != 'jsonl':
             print(f"\n保存方式:")
             print("  1. 合并保存 - 所有演讲保存到一个文件")
             print("  2. 分开保存 - 每个演讲保存为单独文件（使用演讲标题作为文件名）")
@@ -324,7 +413,7 @@ class InteractiveTEDExtractor:
         
         confirm = input(f"\n确定要清空 {len(self.extracted_talks)} 个提取记录吗? (y/n): ").lower().strip()
         
-        if confirm in ['y', 'yes', '是']:
+        if confirm in _YES_ANSWERS:
             self.extracted_talks.clear()
             print("提取历史已清空")
         else:
@@ -332,6 +421,7 @@ class InteractiveTEDExtractor:
     
     def run(self):
         """运行交互式提取器"""
+        self._setup_readline()
         self.show_welcome()
         
         while True:
@@ -342,24 +432,15 @@ class InteractiveTEDExtractor:
                     continue
                 
                 # 处理命令
-                if user_input.lower() in ['quit', 'exit', 'q', '退出']:
+                command = user_input.lower()
+                handler = self._commands.get(command)
+                
+                if command in _QUIT_COMMANDS:
                     print("\n感谢使用TED文字稿提取器!")
                     break
                 
-                elif user_input.lower() in ['help', 'h', '帮助']:
-                    self.show_help()
-                
-                elif user_input.lower() in ['history', '历史']:
-                    self.show_history()
-                
-                elif user_input.lower() in ['save', '保存']:
-                    self.save_results_interactive()
-                
-                elif user_input.lower() in ['batch', '批量']:
-                    self.batch_extract_interactive()
-                
-                elif user_input.lower() in ['clear', '清空']:
-                    self.clear_history()
+                elif handler:
+                    handler()
                 
                 # 检查是否为TED URL
                 elif user_input.startswith('http'):
@@ -379,6 +460,9 @@ class InteractiveTEDExtractor:
             
             except Exception as e:
                 print(f"\n[错误] 发生异常: {e}")
+        
+        self._save_readline_history()
+        self._save_pool.shutdown(wait=True)
 
 
 def main():
@@ -2,6 +2,8 @@
 Setup script for TED Transcript Extractor.
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -10,6 +12,17 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Opt-in: TED_EXTRACTOR_USE_MYPYC=1 compiles the URL/text utilities to a C
+# extension with mypyc (needs mypy at build time); the default is pure Python.
+ext_modules = []
+if os.environ.get("TED_EXTRACTOR_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "--ignore-missing-imports",
+        "--follow-imports=silent",
+        "ted_extractor/utils.py",
+    ])
+
 setup(
     name="ted-transcript-extractor",
     version="1.0.0",
@@ -20,6 +33,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/Xintong120/ted-transcript-extractor",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -41,6 +55,14 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "speedups": [
+            "orjson>=3.6",
+            "selectolax>=0.3.12",
+            "google-re2>=1.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
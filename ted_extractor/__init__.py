@@ -7,7 +7,7 @@ Supports single talk extraction, batch processing, and multiple output formats.
 
 from .extractor import TEDTranscriptExtractor
 from .models import TEDTalk, TranscriptSegment
-from .utils import validate_ted_url, clean_transcript_text
+from .utils import validate_ted_url, validate_ted_urls, clean_transcript_text
 
 __version__ = "1.0.0"
 __author__ = "Xintong120"
@@ -18,5 +18,6 @@ __all__ = [
     "TEDTalk", 
     "TranscriptSegment",
     "validate_ted_url",
+    "validate_ted_urls",
     "clean_transcript_text"
 ]
@@ -6,7 +6,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from .extractor import TEDTranscriptExtractor
 from .utils import validate_ted_url, get_ted_urls_from_text
@@ -38,6 +38,16 @@ def progress_callback(current: int, total: int, talk) -> None:
         print(f"  Error: {talk.error_message}")
 
 
+def iter_url_lines(path: str) -> Iterator[str]:
+    """Yield non-empty, non-comment lines of a URL file without reading it all into memory."""
+    # Plain line iteration rather than mmap, so pipes and /dev/stdin work too
+    with open(path, 'rb') as f:
+        for raw in f:
+            line = raw.strip()
+            if line and not line.startswith(b'#'):  # Skip comments
+                yield line.decode('utf-8')
+
+
 def extract_single_talk(args) -> None:
     """Extract transcript from a single TED talk."""
     if not validate_ted_url(args.url):
@@ -47,7 +57,9 @@ def extract_single_talk(args) -> None:
     extractor = TEDTranscriptExtractor(
         delay_between_requests=args.delay,
         timeout=args.timeout,
-        max_retries=args.retries
+        max_retries=args.retries,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl
     )
     
     print(f"Extracting transcript from: {args.url}")
@@ -76,28 +88,22 @@ def extract_single_talk(args) -> None:
 
 def extract_batch_talks(args) -> None:
     """Extract transcripts from multiple TED talks."""
-    # Read URLs from file
-    try:
-        with open(args.file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"Error: File not found: {args.file}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        sys.exit(1)
-    
-    # Extract URLs from content
+    # Read URLs from file, line by line
     urls = []
-    for line in content.strip().split('\n'):
-        line = line.strip()
-        if line and not line.startswith('#'):  # Skip comments
+    try:
+        for line in iter_url_lines(args.file):
             if validate_ted_url(line):
                 urls.append(line)
             else:
                 # Try to extract URLs from text
                 found_urls = get_ted_urls_from_text(line)
                 urls.extend(found_urls)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.file}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
     
     if not urls:
         print("Error: No valid TED URLs found in file")
@@ -109,7 +115,9 @@ def extract_batch_talks(args) -> None:
     extractor = TEDTranscriptExtractor(
         delay_between_requests=args.delay,
         timeout=args.timeout,
-        max_retries=args.retries
+        max_retries=args.retries,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl
     )
     
     talks = extractor.extract_batch(urls, progress_callback if args.verbose else None)
@@ -143,6 +151,9 @@ Examples:
   # Batch extract from file
   ted-extractor --file urls.txt --output results.csv --format csv
   
+  # Reuse talks extracted by earlier runs
+  ted-extractor --file urls.txt --output results.csv --format csv --cache-dir ~/.cache/ted_extractor
+  
   # Extract with custom settings
   ted-extractor --url "..." --delay 3 --timeout 60 --retries 5 --verbose
         """
@@ -155,7 +166,7 @@ Examples:
     
     # Output options
     parser.add_argument('--output', '-o', help='Output file path')
-    parser.add_argument('--format', '-f', choices=['json', 'csv', 'txt'], 
+    parser.add_argument('--format', '-f', choices=['json', 'jsonl', 'csv', 'txt'], 
                        default='json', help='Output format (default: json)')
     
     # Extraction options
@@ -165,6 +176,10 @@ Examples:
                        help='Request timeout in seconds (default: 30)')
     parser.add_argument('--retries', type=int, default=3,
                        help='Maximum retry attempts (default: 3)')
+    parser.add_argument('--cache-dir',
+                       help='Cache extracted talks in this directory and reuse them on reruns')
+    parser.add_argument('--cache-ttl', type=float,
+                       help='Seconds before cached talks are re-fetched (default: never)')
     
     # Display options
     parser.add_argument('--preview', action='store_true',
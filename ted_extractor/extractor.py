@@ -2,17 +2,288 @@
 Core TED transcript extraction functionality.
 """
 
+import asyncio
+import csv
+import gzip
+import hashlib
 import json
+import os
+import random
+import re
 import requests
+import sys
+import threading
 import time
 import logging
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union
 from datetime import datetime
-from bs4 import BeautifulSoup
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 from .models import TEDTalk, TranscriptSegment
 from .utils import validate_ted_url, clean_transcript_text
 
+try:
+    import orjson
+except ImportError:  # Optional, faster JSON parsing and serialization
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional, faster HTML parsing for the fallback path
+    LexborHTMLParser = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON from str or UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+# TED pages are Next.js apps that embed all talk data in one JSON script tag
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+
+def _url_host(url: str) -> str:
+    """Return the network location of an absolute URL (the rate limiter's per-host key)."""
+    netloc = url.partition('://')[2]
+    for separator in '/?#':
+        netloc = netloc.partition(separator)[0]
+    return netloc
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across a batch (speakers, events, languages)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _page_props(raw: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Decode a Next.js data blob and return its ``props.pageProps`` dict."""
+    try:
+        json_data = _loads(raw)
+    except ValueError:
+        return None
+    props = json_data.get('props') if isinstance(json_data, dict) else None
+    page_props = props.get('pageProps') if isinstance(props, dict) else None
+    return page_props if isinstance(page_props, dict) else None
+
+
+def _json_scripts(content: Union[bytes, bytearray]) -> Iterator[str]:
+    """Yield the text of every application/json script tag in a page."""
+    content = bytes(content)  # HTML parsers want immutable input
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for node in tree.css('script[type="application/json"]'):
+            yield node.text()
+        return
+    
+    # Imported here: BeautifulSoup is only needed for pages without __NEXT_DATA__
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'lxml')
+    for script in soup.find_all('script', type='application/json'):
+        yield script.get_text()
+
+
+class _RateLimitedRetry(Retry):
+    """
+    urllib3 retry policy driven by the extractor's per-host rate limiter.
+    
+    Each retried response or connection error updates the host's pause, so
+    other workers hold off too, and the retry then waits for the host's next
+    request slot instead of sleeping on a schedule of its own. Retries stop once
+    the fetch has used up the extractor's attempts, including any spent on
+    failed body reads.
+    """
+    
+    def __init__(self, *args, extractor: Optional['TEDTranscriptExtractor'] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.extractor = extractor
+    
+    def new(self, **kwargs) -> '_RateLimitedRetry':
+        return super().new(extractor=self.extractor, **kwargs)
+    
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None) -> '_RateLimitedRetry':
+        retrying = self.extractor is not None and (
+            error is not None or response is not None and response.status in self.status_forcelist)
+        if retrying and not self.extractor._retry_allowed():
+            reason = error or ResponseError(f"too many {response.status} error responses")
+            raise MaxRetryError(_pool, url, reason) from reason
+        
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if retrying:
+            self.extractor._note_retry(response, error)
+        return retry
+    
+    def sleep(self, response=None) -> None:
+        if self.extractor is None:
+            super().sleep(response)
+        else:
+            self.extractor._wait_for_retry()
+
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_page(content: Union[bytes, bytearray], talk: TEDTalk) -> TEDTalk:
+    """Parse fetched page content into ``talk`` and set its status."""
+    match = _NEXT_DATA_RE.search(content)
+    page_props = _page_props(match.group(1)) if match else None
+
+    # Extract metadata and transcript
+    if page_props is not None:
+        _extract_metadata(page_props, talk)
+        _extract_transcript(page_props, talk)
+    elif b'"pageProps"' in content:
+        # Fall back to a full HTML parse when the data blob isn't where we expect it;
+        # pages without any page props can't yield a transcript, so skip the parse
+        logger.debug("__NEXT_DATA__ not found, scanning all JSON scripts: %s", talk.url)
+        _extract_all(_json_scripts(content), talk)
+
+    if talk.transcript:
+        talk.success = True
+        talk.extraction_method = "json_parsing"
+        logger.info("Successfully extracted transcript (%s characters)", len(talk.transcript))
+    else:
+        talk.error_message = "No transcript found"
+        logger.warning("No transcript found for: %s", talk.url)
+
+    return talk
+
+
+def _extract_all(scripts: Iterable[str], talk: TEDTalk) -> None:
+    """Extract metadata and transcript in a single pass over the page JSON."""
+    has_metadata = has_transcript = False
+
+    for content in scripts:
+        # Cheap substring check before paying for a full JSON decode
+        if '"pageProps"' not in content:
+            continue
+
+        page_props = _page_props(content)
+        if page_props is None:
+            continue
+
+        if not has_metadata:
+            has_metadata = _extract_metadata(page_props, talk)
+        if not has_transcript:
+            has_transcript = _extract_transcript(page_props, talk)
+        if has_metadata and has_transcript:
+            break
+
+
+def _extract_metadata(page_props: Dict[str, Any], talk: TEDTalk) -> bool:
+    """Extract metadata from decoded page props. Returns True if found."""
+    try:
+        # Extract from pageProps.videoData
+        video_data = page_props.get('videoData', {})
+
+        if video_data:
+            talk.talk_id = str(video_data.get('id', ''))
+            talk.title = video_data.get('title', '')
+            talk.speaker = _intern(video_data.get('presenterDisplayName', ''))
+            talk.description = video_data.get('description', '')
+            talk.duration = video_data.get('duration')
+            talk.views = video_data.get('viewedCount')
+            talk.recorded_date = video_data.get('recordedOn', '')
+            talk.published_date = video_data.get('publishedAt', '')
+            talk.event = _intern(video_data.get('videoContext', ''))
+            return True
+
+    except Exception as e:
+        logger.warning("Error extracting metadata: %s", e)
+
+    return False
+
+
+def _extract_transcript(page_props: Dict[str, Any], talk: TEDTalk) -> bool:
+    """Extract transcript from decoded page props. Returns True if found."""
+    try:
+        # Navigate to transcript data; malformed structures fail fast by
+        # raising instead of being type-checked at every level
+        try:
+            translation = page_props['transcriptData']['translation']
+            paragraphs = enumerate(translation['paragraphs'])
+        except (KeyError, TypeError):
+            return False
+
+        # Cue texts and their separators, joined once at the end: cues within
+        # a paragraph are separated by a space, paragraphs by a blank line
+        parts = []
+        segments = []
+
+        for para_idx, paragraph in paragraphs:
+            separator = '\n\n' if parts else ''
+
+            try:
+                for cue in paragraph['cues']:
+                    try:
+                        text = cue['text'].strip()
+                    except (KeyError, TypeError, AttributeError):
+                        continue
+
+                    if text:
+                        parts.append(separator)
+                        parts.append(text)
+                        separator = ' '
+
+                        # Create segment
+                        segments.append(TranscriptSegment(
+                            text=text,
+                            start_time=cue.get('startTime'),
+                            end_time=cue.get('endTime'),
+                            paragraph_index=para_idx
+                        ))
+            except (KeyError, TypeError):
+                continue
+
+        if parts:
+            talk.transcript = ''.join(parts)
+            talk.transcript_segments = segments
+
+            # Clean transcript
+            talk.transcript = clean_transcript_text(talk.transcript)
+
+            # Extract language info
+            try:
+                talk.language = _intern(translation.get('language', {}).get('languageCode', 'en'))
+            except AttributeError:
+                pass
+
+            return True
+
+    except Exception as e:
+        logger.warning("Error extracting transcript: %s", e)
+
+    return False
+
 
 class TEDTranscriptExtractor:
     """
@@ -20,38 +291,98 @@ class TEDTranscriptExtractor:
     
     Features:
     - Extract transcripts from individual TED talk URLs
-    - Batch processing of multiple talks
-    - Multiple output formats (JSON, CSV, TXT)
+    - Batch processing of multiple talks (threaded or concurrent async)
+    - Multiple output formats (JSON, JSONL, CSV, TXT)
     - Robust error handling and retry logic
-    - Rate limiting to respect TED's servers
+    - Per-host rate limiting that adapts to rate-limit response headers
+    - Optional in-memory and on-disk caching of extracted talks
     """
     
+    # Number of talks kept in the in-process cache
+    MEMORY_CACHE_SIZE = 128
+    
+    # Upper bound for backoff after throttling or server errors, in seconds
+    MAX_BACKOFF = 60.0
+    
+    # Bytes read per chunk when streaming a page body
+    STREAM_CHUNK_SIZE = 1 << 16
+    
+    # Responses worth retrying: throttling and transient server errors
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+    
+    # Seconds an idle pooled connection is kept open; outlasts the longest backoff
+    KEEPALIVE_TIMEOUT = 75.0
+    
     def __init__(self, 
                  delay_between_requests: float = 2.0,
                  timeout: int = 30,
                  max_retries: int = 3,
-                 user_agent: str = None):
+                 user_agent: str = None,
+                 concurrency: int = 4,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 cache_ttl: Optional[float] = None):
         """
         Initialize the extractor.
         
         Args:
-            delay_between_requests: Seconds to wait between requests
+            delay_between_requests: Seconds to wait between requests to the same
+                host, unless rate-limit response headers allow a different pace
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts per page (retries happen on
+                connection errors and throttling/server-error responses)
             user_agent: Custom user agent string
+            concurrency: Maximum number of talks extracted at once in batches
+            cache_dir: Directory for the on-disk transcript cache (disabled if None)
+            cache_ttl: Seconds before a cached talk expires (never if None)
         """
         self.delay = delay_between_requests
         self.timeout = timeout
         self.max_retries = max_retries
+        self.concurrency = max(1, concurrency)
+        
+        # Setup transcript cache
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         
-        # Setup session with headers
+        # Per-host earliest start time (time.monotonic()) of the next request, and
+        # of any throttling pause; a pause also holds back requests already scheduled
+        self._next_request_ts: Dict[str, float] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        
+        # URL being fetched on each thread, for the adapter's retry policy
+        self._fetching = threading.local()
+        
+        # Setup session with headers and a pooled, keep-alive connection adapter
+        # whose retries wait on the per-host rate limiter
         self.session = requests.Session()
+        retry = _RateLimitedRetry(total=max(0, max_retries - 1),
+                                  status_forcelist=self.RETRY_STATUSES, raise_on_status=False,
+                                  extractor=self)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(20, self.concurrency),
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
         # Setup logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+    
+    def __enter__(self) -> 'TEDTranscriptExtractor':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self.session.close()
         
     def extract_single(self, url: str) -> TEDTalk:
         """
@@ -71,32 +402,24 @@ class TEDTranscriptExtractor:
                 talk.error_message = f"Invalid TED URL: {url}"
                 return talk
             
-            self.logger.info(f"Extracting transcript from: {url}")
+            cached = self._load_cached(url)
+            if cached is not None:
+                return cached
+            
+            self.logger.info("Extracting transcript from: %s", url)
             
             # Fetch page content
-            response = self._fetch_page(url)
-            if not response:
+            content = self._fetch_page(url)
+            if content is None:
                 talk.error_message = "Failed to fetch page content"
                 return talk
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract metadata and transcript
-            self._extract_metadata(soup, talk)
-            self._extract_transcript(soup, talk)
-            
-            if talk.transcript:
-                talk.success = True
-                talk.extraction_method = "json_parsing"
-                self.logger.info(f"Successfully extracted transcript ({len(talk.transcript)} characters)")
-            else:
-                talk.error_message = "No transcript found"
-                self.logger.warning(f"No transcript found for: {url}")
+            _parse_page(content, talk)
+            self._store_cached(talk)
             
         except Exception as e:
             talk.error_message = f"Extraction error: {str(e)}"
-            self.logger.error(f"Error extracting {url}: {e}")
+            self.logger.error("Error extracting %s: %s", url, e)
         
         return talk
     
@@ -105,166 +428,410 @@ class TEDTranscriptExtractor:
         """
         Extract transcripts from multiple TED talk URLs.
         
+        Up to ``concurrency`` talks are extracted at once on worker threads;
+        request starts are still spaced per host by the rate limiter.
+        
         Args:
             urls: List of TED talk URLs
-            progress_callback: Optional callback function for progress updates
+            progress_callback: Optional callback function for progress updates,
+                called from the calling thread as each talk completes
             
         Returns:
-            List of TEDTalk objects
+            List of TEDTalk objects in the same order as ``urls``
         """
-        results = []
+        urls = list(urls)
         total = len(urls)
+        results: List[Optional[TEDTalk]] = [None] * total
         
-        self.logger.info(f"Starting batch extraction of {total} talks")
+        self.logger.info("Starting batch extraction of %s talks", total)
         
-        for i, url in enumerate(urls):
-            try:
-                talk = self.extract_single(url)
-                results.append(talk)
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, total) or 1) as pool:
+            futures = {pool.submit(self.extract_single, url): i for i, url in enumerate(urls)}
+            
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                url = urls[i]
+                try:
+                    talk = future.result()
+                except Exception as e:
+                    self.logger.error("Batch extraction error for %s: %s", url, e)
+                    # Create failed talk object
+                    talk = TEDTalk(
+                        url=url,
+                        extracted_at=datetime.now(),
+                        error_message=f"Batch extraction error: {str(e)}"
+                    )
+                results[i] = talk
                 
-                # Progress callback
+                # Progress callback (rate limiting happens per request in _fetch_page)
                 if progress_callback:
-                    progress_callback(i + 1, total, talk)
-                
-                # Rate limiting
-                if i < total - 1:  # Don't delay after last request
-                    time.sleep(self.delay)
-                    
-            except Exception as e:
-                self.logger.error(f"Batch extraction error for {url}: {e}")
-                # Create failed talk object
-                failed_talk = TEDTalk(
-                    url=url,
-                    extracted_at=datetime.now(),
-                    error_message=f"Batch extraction error: {str(e)}"
-                )
-                results.append(failed_talk)
+                    progress_callback(completed, total, talk)
         
         successful = sum(1 for talk in results if talk.success)
-        self.logger.info(f"Batch extraction completed: {successful}/{total} successful")
+        self.logger.info("Batch extraction completed: %s/%s successful", successful, total)
         
         return results
     
-    def _fetch_page(self, url: str) -> Optional[requests.Response]:
-        """Fetch page content with retry logic."""
+    async def extract_batch_async(self, urls: Iterable[str],
+                                  progress_callback: Optional[callable] = None,
+                                  parse_processes: Optional[int] = None) -> List[TEDTalk]:
+        """
+        Extract transcripts from multiple TED talk URLs concurrently.
+        
+        Up to ``concurrency`` pages are fetched at once over a single aiohttp
+        session. Request starts are still spaced per host by the same rate
+        limiter as the synchronous path, so TED's servers are not hit in bursts.
+        
+        Args:
+            urls: Iterable of TED talk URLs
+            progress_callback: Optional callback function for progress updates,
+                called as each talk completes (in a worker thread, one call at a time)
+            parse_processes: Parse pages in a pool of this many worker processes
+                instead of threads, so parsing of large batches isn't limited by the
+                GIL (0 uses one process per CPU; None parses on threads)
+            
+        Returns:
+            List of TEDTalk objects in the same order as ``urls``
+        """
+        # Imported here rather than at module level: aiohttp is optional and is
+        # the heaviest import in the package, so sync-only users never pay for it
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("extract_batch_async requires aiohttp: pip install aiohttp") from None
+        
+        urls = list(urls)
+        total = len(urls)
+        completed = 0
+        semaphore = asyncio.BoundedSemaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        
+        self.logger.info("Starting async batch extraction of %s talks (concurrency=%s)",
+                         total, self.concurrency)
+        
+        async def run_one(session, url: str) -> TEDTalk:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    talk = await self._extract_single_async(session, url, parse_executor)
+                except Exception as e:
+                    self.logger.error("Batch extraction error for %s: %s", url, e)
+                    talk = TEDTalk(
+                        url=url,
+                        extracted_at=datetime.now(),
+                        error_message=f"Batch extraction error: {str(e)}"
+                    )
+            
+            completed += 1
+            if progress_callback:
+                # Run the callback off the event loop so slow output doesn't stall fetches;
+                # a single worker keeps calls ordered and non-overlapping
+                await loop.run_in_executor(callback_executor, progress_callback,
+                                           completed, total, talk)
+            return talk
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency,
+                                         keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                                         ttl_dns_cache=300)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        parse_executor = (ProcessPoolExecutor(max_workers=parse_processes or None)
+                          if parse_processes is not None else None)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as callback_executor:
+                async with aiohttp.ClientSession(headers=headers, timeout=timeout,
+                                                 connector=connector) as session:
+                    results = await asyncio.gather(*(run_one(session, url) for url in urls))
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+        
+        successful = sum(1 for talk in results if talk.success)
+        self.logger.info("Async batch extraction completed: %s/%s successful", successful, total)
+        
+        return list(results)
+    
+    async def _extract_single_async(self, session, url: str,
+                                    parse_executor: Optional[Executor] = None) -> TEDTalk:
+        """
+        Async counterpart of extract_single() using a shared aiohttp session.
+        
+        Pages are parsed in ``parse_executor``, or on the loop's default
+        thread pool if it is None.
+        """
+        talk = TEDTalk(url=url, extracted_at=datetime.now())
+        
+        if not validate_ted_url(url):
+            talk.error_message = f"Invalid TED URL: {url}"
+            return talk
+        
+        # Cache lookups, parsing and cache writes run off the event loop
+        # so disk I/O and HTML/JSON parsing don't block other fetches
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self._load_cached, url)
+        if cached is not None:
+            return cached
+        
+        self.logger.info("Extracting transcript from: %s", url)
+        
+        content = await self._fetch_page_async(session, url)
+        if not content:
+            talk.error_message = "Failed to fetch page content"
+            return talk
+        
+        talk = await loop.run_in_executor(parse_executor, _parse_page, content, talk)
+        await loop.run_in_executor(None, self._store_cached, talk)
+        return talk
+    
+    async def _fetch_page_async(self, session, url: str) -> Optional[bytes]:
+        """Fetch page content asynchronously with retry logic."""
+        import aiohttp  # Already loaded by extract_batch_async()
+        
         for attempt in range(self.max_retries):
+            await self._wait_for_request_slot_async(url)
             try:
-                response = self.session.get(url, timeout=self.timeout)
-                if response.status_code == 200:
-                    return response
-                else:
-                    self.logger.warning(f"HTTP {response.status_code} for {url}, attempt {attempt + 1}")
+                async with session.get(url) as response:
+                    self._update_rate_limit(url, response.status, response.headers, attempt)
+                    if response.status == 200:
+                        return await response.read()
+                    self.logger.warning("HTTP %s for %s, attempt %s", response.status, url, attempt + 1)
+                    if response.status not in self.RETRY_STATUSES:
+                        return None
                     
-            except requests.RequestException as e:
-                self.logger.warning(f"Request failed for {url}, attempt {attempt + 1}: {e}")
-            
-            if attempt < self.max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning("Request failed for %s, attempt %s: %s", url, attempt + 1, e)
+                self._back_off(url, attempt)
         
         return None
     
-    def _extract_metadata(self, soup: BeautifulSoup, talk: TEDTalk) -> None:
-        """Extract metadata from page."""
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        Reserve the next request slot for the URL's host.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        host = _url_host(url)
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_ts.get(host, 0.0),
+                        self._paused_until.get(host, 0.0))
+            self._next_request_ts[host] = start + self.delay * random.uniform(0.5, 1.5)
+        return start - now
+    
+    def _is_paused(self, url: str) -> bool:
+        """Check whether the URL's host is inside a throttling pause."""
+        with self._throttle_lock:
+            return self._paused_until.get(_url_host(url), 0.0) > time.monotonic()
+    
+    def _wait_for_request_slot(self, url: str) -> None:
+        """
+        Sleep until a request to the URL's host may be sent.
+        
+        A pause set while waiting (another worker was throttled) moves the
+        request behind it rather than letting it through on its old slot.
+        """
+        time.sleep(self._reserve_request_slot(url))
+        while self._is_paused(url):
+            time.sleep(self._reserve_request_slot(url))
+    
+    async def _wait_for_request_slot_async(self, url: str) -> None:
+        """Async counterpart of _wait_for_request_slot()."""
+        await asyncio.sleep(self._reserve_request_slot(url))
+        while self._is_paused(url):
+            await asyncio.sleep(self._reserve_request_slot(url))
+    
+    def _retry_allowed(self) -> bool:
+        """Check whether the current fetch has attempts left."""
+        return self._fetching.attempt + 1 < self.max_retries
+    
+    def _note_retry(self, response, error: Optional[Exception]) -> None:
+        """Feed a response or error the adapter is about to retry to the rate limiter."""
+        url = self._fetching.url
+        attempt = self._fetching.attempt
+        self._fetching.attempt = attempt + 1
+        if response is not None:
+            self.logger.warning("HTTP %s for %s, attempt %s", response.status, url, attempt + 1)
+            self._update_rate_limit(url, response.status, response.headers, attempt)
+        else:
+            self.logger.warning("Request failed for %s, attempt %s: %s", url, attempt + 1, error)
+            self._back_off(url, attempt)
+    
+    def _wait_for_retry(self) -> None:
+        """Wait for the rate limiter before the adapter retries the current fetch."""
+        self._wait_for_request_slot(self._fetching.url)
+    
+    def _update_rate_limit(self, url: str, status: int, headers, attempt: int) -> None:
+        """
+        Adapt the host's request pacing from a response.
+        
+        ``Retry-After`` pauses the host for the given time. ``X-RateLimit-Remaining``
+        and ``X-RateLimit-Reset`` spread the remaining budget over the reset window
+        (or pause until the reset when it is used up). Throttling and server errors
+        without such headers back off exponentially.
+        
+        Pauses only ever extend an existing pause, so one worker's response can't
+        cut short a longer pause another worker just set; spreading the budget
+        sets the spacing of the next request and may shorten it.
+        """
+        retry_after = _parse_retry_after(headers.get('Retry-After'))
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        
+        if retry_after is not None:
+            pause = retry_after
+        elif remaining is not None and reset is not None:
+            try:
+                remaining, reset = int(remaining), float(reset)
+            except ValueError:
+                return
+            if reset > 1e9:  # Epoch timestamp rather than seconds until reset
+                reset -= time.time()
+            reset = max(0.0, reset)
+            if remaining > 0:
+                host = _url_host(url)
+                with self._throttle_lock:
+                    self._next_request_ts[host] = time.monotonic() + min(reset / remaining,
+                                                                         self.MAX_BACKOFF)
+                return
+            pause = reset
+        elif status == 429 or status >= 500:
+            self._back_off(url, attempt)
+            return
+        else:
+            return
+        
+        self._pause_host(url, pause)
+    
+    def _back_off(self, url: str, attempt: int) -> None:
+        """Delay the host's next request with jittered exponential backoff."""
+        self._pause_host(url, 2 ** attempt + random.random())
+    
+    def _pause_host(self, url: str, pause: float) -> None:
+        """Pause the URL's host for ``pause`` seconds (capped), unless already paused longer."""
+        host = _url_host(url)
+        with self._throttle_lock:
+            self._paused_until[host] = max(self._paused_until.get(host, 0.0),
+                                           time.monotonic() + min(pause, self.MAX_BACKOFF))
+    
+    def _cache_path(self, url: str) -> Path:
+        """Get the on-disk cache file for a URL."""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json.gz"
+    
+    def _is_expired(self, timestamp: float) -> bool:
+        """Check whether a cache entry written at ``timestamp`` has expired."""
+        return self.cache_ttl is not None and time.time() - timestamp > self.cache_ttl
+    
+    def _load_cached(self, url: str) -> Optional[TEDTalk]:
+        """Look up a previously extracted talk in the memory and disk caches."""
+        with self._cache_lock:
+            entry = self._memory_cache.get(url)
+            if entry:
+                cached_at, talk = entry
+                if not self._is_expired(cached_at):
+                    self._memory_cache.move_to_end(url)
+                    self.logger.debug("Memory cache hit for: %s", url)
+                    return talk
+                del self._memory_cache[url]
+        
+        if not self.cache_dir:
+            return None
+        
+        path = self._cache_path(url)
         try:
-            # Find JSON data
-            script_tags = soup.find_all('script', type='application/json')
+            cached_at = path.stat().st_mtime
+            if self._is_expired(cached_at):
+                return None
             
-            for script in script_tags:
-                try:
-                    json_data = json.loads(script.get_text())
-                    
-                    # Extract from pageProps.videoData
-                    if 'props' in json_data and 'pageProps' in json_data['props']:
-                        video_data = json_data['props']['pageProps'].get('videoData', {})
-                        
-                        if video_data:
-                            talk.talk_id = str(video_data.get('id', ''))
-                            talk.title = video_data.get('title', '')
-                            talk.speaker = video_data.get('presenterDisplayName', '')
-                            talk.description = video_data.get('description', '')
-                            talk.duration = video_data.get('duration')
-                            talk.views = video_data.get('viewedCount')
-                            talk.recorded_date = video_data.get('recordedOn', '')
-                            talk.published_date = video_data.get('publishedAt', '')
-                            talk.event = video_data.get('videoContext', '')
-                            break
-                            
-                except json.JSONDecodeError:
-                    continue
-                    
-        except Exception as e:
-            self.logger.warning(f"Error extracting metadata: {e}")
+            with gzip.open(path, 'rb') as f:
+                talk = TEDTalk.from_dict(_loads(f.read()))
+                
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            self.logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+        
+        self.logger.debug("Disk cache hit for: %s", url)
+        self._remember(url, talk, cached_at)
+        return talk
     
-    def _extract_transcript(self, soup: BeautifulSoup, talk: TEDTalk) -> None:
-        """Extract transcript from page JSON data."""
+    def _store_cached(self, talk: TEDTalk) -> None:
+        """Store a successfully extracted talk in the memory and disk caches."""
+        if not talk.success:
+            return
+        
+        self._remember(talk.url, talk, time.time())
+        
+        if not self.cache_dir:
+            return
+        
+        # Write to a private temp file first so concurrent writers never interleave
+        path = self._cache_path(talk.url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
-            script_tags = soup.find_all('script', type='application/json')
+            with gzip.open(tmp_path, 'wb', compresslevel=3) as f:
+                f.write(_dumps(talk.to_dict()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Failed to write cache entry for %s: %s", talk.url, e)
+    
+    def _remember(self, url: str, talk: TEDTalk, cached_at: float) -> None:
+        """Add a talk to the bounded in-memory cache."""
+        with self._cache_lock:
+            self._memory_cache[url] = (cached_at, talk)
+            self._memory_cache.move_to_end(url)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _fetch_page(self, url: str) -> Optional[bytearray]:
+        """
+        Fetch page content; retries are handled by the session's adapter,
+        which waits on the per-host rate limiter between attempts.
+        
+        The adapter only retries up to the response headers, so a body read
+        that fails (connection dropped, read timeout) is retried here, within
+        the same ``max_retries`` attempts.
+        
+        The body is streamed straight into one growing buffer rather than
+        collected as chunks and joined, which keeps peak memory near the page size.
+        """
+        if self.max_retries < 1:
+            return None
+        
+        self._fetching.url = url
+        self._fetching.attempt = 0
+        while True:
+            self._wait_for_request_slot(url)
+            try:
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+            except requests.RequestException as e:
+                # The adapter has already retried this up to the attempt budget
+                self.logger.warning("Request failed for %s: %s", url, e)
+                self._back_off(url, self._fetching.attempt)
+                return None
             
-            for script in script_tags:
+            attempt = self._fetching.attempt
+            with response:
+                self._update_rate_limit(url, response.status_code, response.headers, attempt)
+                if response.status_code != 200:
+                    self.logger.warning("HTTP %s for %s", response.status_code, url)
+                    return None
+                
                 try:
-                    content = script.get_text()
-                    
-                    if 'transcript' in content.lower():
-                        json_data = json.loads(content)
-                        
-                        # Navigate to transcript data
-                        if 'props' in json_data and 'pageProps' in json_data['props']:
-                            transcript_data = json_data['props']['pageProps'].get('transcriptData')
-                            
-                            if transcript_data and isinstance(transcript_data, dict):
-                                translation = transcript_data.get('translation')
-                                
-                                if translation and isinstance(translation, dict):
-                                    paragraphs = translation.get('paragraphs')
-                                    
-                                    if paragraphs and isinstance(paragraphs, list):
-                                        transcript_parts = []
-                                        segments = []
-                                        
-                                        for para_idx, paragraph in enumerate(paragraphs):
-                                            if isinstance(paragraph, dict):
-                                                cues = paragraph.get('cues')
-                                                
-                                                if cues and isinstance(cues, list):
-                                                    paragraph_text = []
-                                                    
-                                                    for cue in cues:
-                                                        if isinstance(cue, dict):
-                                                            text = cue.get('text', '').strip()
-                                                            if text:
-                                                                paragraph_text.append(text)
-                                                                
-                                                                # Create segment
-                                                                segment = TranscriptSegment(
-                                                                    text=text,
-                                                                    start_time=cue.get('startTime'),
-                                                                    end_time=cue.get('endTime'),
-                                                                    paragraph_index=para_idx
-                                                                )
-                                                                segments.append(segment)
-                                                    
-                                                    if paragraph_text:
-                                                        transcript_parts.append(' '.join(paragraph_text))
-                                        
-                                        if transcript_parts:
-                                            talk.transcript = '\n\n'.join(transcript_parts)
-                                            talk.transcript_segments = segments
-                                            
-                                            # Clean transcript
-                                            talk.transcript = clean_transcript_text(talk.transcript)
-                                            
-                                            # Extract language info
-                                            lang_info = translation.get('language', {})
-                                            if isinstance(lang_info, dict):
-                                                talk.language = lang_info.get('languageCode', 'en')
-                                            
-                                            return
-                                            
-                except json.JSONDecodeError:
-                    continue
-                    
-        except Exception as e:
-            self.logger.warning(f"Error extracting transcript: {e}")
+                    content = bytearray()
+                    for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                        content += chunk
+                    return content
+                except requests.RequestException as e:
+                    self.logger.warning("Reading %s failed, attempt %s: %s", url, attempt + 1, e)
+                    self._back_off(url, attempt)
+            
+            if attempt + 1 >= self.max_retries:
+                return None
+            self._fetching.attempt = attempt + 1
     
     def save_results(self, talks: List[TEDTalk], 
                     output_file: str, 
@@ -275,13 +842,15 @@ class TEDTranscriptExtractor:
         Args:
             talks: List of TEDTalk objects
             output_file: Output file path
-            format: Output format ('json', 'csv', 'txt')
+            format: Output format ('json', 'jsonl', 'csv', 'txt')
             
         Returns:
             Path to saved file
         """
         if format.lower() == 'json':
             return self._save_json(talks, output_file)
+        elif format.lower() == 'jsonl':
+            return self._save_jsonl(talks, output_file)
         elif format.lower() == 'csv':
             return self._save_csv(talks, output_file)
         elif format.lower() == 'txt':
@@ -291,45 +860,55 @@ class TEDTranscriptExtractor:
     
     def _save_json(self, talks: List[TEDTalk], output_file: str) -> str:
         """Save results as JSON."""
-        import json
-        
         data = [talk.to_dict() for talk in talks]
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(data, indent=True))
         
         return output_file
     
-    def _save_csv(self, talks: List[TEDTalk], output_file: str) -> str:
-        """Save results as CSV."""
-        import pandas as pd
-        
-        data = []
-        for talk in talks:
-            row = talk.to_dict()
-            # Flatten transcript_segments for CSV
-            if row.get('transcript_segments'):
-                row['transcript_segments'] = str(len(row['transcript_segments']))
-            data.append(row)
+    def _save_jsonl(self, talks: List[TEDTalk], output_file: str) -> str:
+        """Save results as JSON Lines, streaming one talk per line."""
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.writelines(_dumps(talk.to_dict()) + b'\n' for talk in talks)
         
-        df = pd.DataFrame(data)
-        df.to_csv(output_file, index=False, encoding='utf-8')
+        return output_file
+    
+    def _save_csv(self, talks: List[TEDTalk], output_file: str) -> str:
+        """Save results as CSV, streaming one row per talk."""
+        with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            writer = None
+            for talk in talks:
+                row = talk.to_dict()
+                # Flatten transcript_segments for CSV
+                if row.get('transcript_segments'):
+                    row['transcript_segments'] = str(len(row['transcript_segments']))
+                
+                if writer is None:
+                    # Every talk serializes the same fields, so the first row fixes the header
+                    writer = csv.DictWriter(f, fieldnames=list(row), lineterminator='\n')
+                    writer.writeheader()
+                writer.writerow(row)
         
         return output_file
     
     def _save_txt(self, talks: List[TEDTalk], output_file: str) -> str:
-        """Save transcripts as plain text."""
-        with open(output_file, 'w', encoding='utf-8') as f:
+        """Save transcripts as plain text, streaming one talk at a time."""
+        separator = "\n\n" + "=" * 50 + "\n\n"
+        
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             for i, talk in enumerate(talks):
                 if talk.success and talk.transcript:
-                    f.write(f"=== TED Talk {i+1} ===\n")
-                    f.write(f"Title: {talk.title or 'Unknown'}\n")
-                    f.write(f"Speaker: {talk.speaker or 'Unknown'}\n")
-                    f.write(f"URL: {talk.url}\n")
-                    f.write(f"Duration: {talk.duration or 'Unknown'} seconds\n")
-                    f.write(f"Views: {talk.views or 'Unknown'}\n")
-                    f.write("\n--- Transcript ---\n")
-                    f.write(talk.transcript)
-                    f.write("\n\n" + "="*50 + "\n\n")
+                    f.writelines((
+                        f"=== TED Talk {i+1} ===\n",
+                        f"Title: {talk.title or 'Unknown'}\n",
+                        f"Speaker: {talk.speaker or 'Unknown'}\n",
+                        f"URL: {talk.url}\n",
+                        f"Duration: {talk.duration or 'Unknown'} seconds\n",
+                        f"Views: {talk.views or 'Unknown'}\n",
+                        "\n--- Transcript ---\n",
+                        talk.transcript,
+                        separator,
+                    ))
         
         return output_file
@@ -2,18 +2,49 @@
 Data models for TED transcript extraction.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from .utils import count_words
 
-@dataclass
-class TranscriptSegment:
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__; long talks
+# produce thousands of transcript segments
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _TextLowerSlot:
+    """Storage for TranscriptSegment.text_lower, kept out of the dataclass fields."""
+    __slots__ = ('_text_lower',)
+
+
+@dataclass(**_SLOTS)
+class TranscriptSegment(_TextLowerSlot):
     """Represents a single segment of transcript text."""
     text: str
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     paragraph_index: Optional[int] = None
+    
+    @property
+    def text_lower(self) -> str:
+        """Lowercased text, computed once for repeated keyword searches."""
+        try:
+            return self._text_lower
+        except AttributeError:
+            self._text_lower = self.text.lower()
+            return self._text_lower
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'text': self.text,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'paragraph_index': self.paragraph_index
+        }
 
 
 @dataclass
@@ -45,18 +76,41 @@ class TEDTalk:
     success: bool = False
     error_message: Optional[str] = None
     
+    # (transcript, word count) memo for get_word_count(); deliberately unannotated so
+    # it is a plain attribute, not a dataclass field seen by asdict() or fields()
+    _word_count_cache = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
+        result = {name: getattr(self, name) for name in _TALK_FIELDS}
+        for name in _TALK_DATETIME_FIELDS:
+            value = result[name]
             if isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif isinstance(value, list) and value and isinstance(value[0], TranscriptSegment):
-                result[key] = [segment.__dict__ for segment in value]
-            else:
-                result[key] = value
+                result[name] = value.isoformat()
+        for name in _TALK_SEGMENT_FIELDS:
+            value = result[name]
+            if value:
+                result[name] = [segment.to_dict() for segment in value]
         return result
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TEDTalk':
+        """Create a TEDTalk from a dictionary produced by to_dict()."""
+        known = {f.name for f in fields(cls) if f.init}
+        data = {key: value for key, value in data.items() if key in known}
+        
+        if isinstance(data.get('extracted_at'), str):
+            data['extracted_at'] = datetime.fromisoformat(data['extracted_at'])
+        for key in _TALK_INTERNED_FIELDS:
+            if type(data.get(key)) is str:
+                data[key] = sys.intern(data[key])
+        if data.get('transcript_segments'):
+            data['transcript_segments'] = [
+                TranscriptSegment(**segment) for segment in data['transcript_segments']
+            ]
+        
+        return cls(**data)
+    
     def get_clean_transcript(self) -> str:
         """Get transcript with basic cleaning applied."""
         if not self.transcript:
@@ -69,12 +123,28 @@ class TEDTalk:
         return cleaned
     
     def get_word_count(self) -> int:
-        """Get approximate word count of transcript."""
+        """Get approximate word count of transcript (computed once per transcript)."""
         if not self.transcript:
             return 0
-        return len(self.transcript.split())
+        
+        cache = self._word_count_cache
+        if cache is None or cache[0] is not self.transcript:
+            cache = self._word_count_cache = (self.transcript, count_words(self.transcript))
+        return cache[1]
     
     def get_reading_time_minutes(self, words_per_minute: int = 200) -> float:
         """Estimate reading time in minutes."""
         word_count = self.get_word_count()
         return word_count / words_per_minute if word_count > 0 else 0.0
+
+
+# Serialized TEDTalk fields, resolved once from the annotations so to_dict()
+# doesn't have to inspect every value's type
+_TALK_FIELDS = tuple(f.name for f in fields(TEDTalk) if not f.name.startswith('_'))
+_TALK_DATETIME_FIELDS = tuple(f.name for f in fields(TEDTalk) if f.type == Optional[datetime])
+_TALK_SEGMENT_FIELDS = tuple(f.name for f in fields(TEDTalk)
+                             if f.type == Optional[List[TranscriptSegment]])
+
+# Low-cardinality fields shared by many talks in a batch; from_dict() interns
+# them so reloaded talks share one string object per distinct value
+_TALK_INTERNED_FIELDS = ('speaker', 'event', 'language')
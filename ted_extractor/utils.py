@@ -3,11 +3,95 @@ Utility functions for TED transcript extraction.
 """
 
 import re
-from typing import List
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
+try:
+    import re2
+except ImportError:  # Optional, linear-time scanning of large text inputs
+    re2 = None
 
-def validate_ted_url(url: str) -> bool:
+
+# A complete TED talk URL: TED host, /talks/<slug>, then optional subpath/query/fragment.
+# Group 1 captures the slug, so one match serves both validation and ID extraction.
+_TED_URL_RE = re.compile(r'^https?://(?:www\.)?ted\.com/talks/([A-Za-z0-9_\-]+)(?:[/?#]\S*)?$', re.ASCII)
+
+# Literal substring every TED talk URL contains; a cheap prefilter before matching
+_TED_TALKS_MARKER = 'ted.com/talks/'
+
+# Candidate TED talk URLs in free text: everything after /talks/ up to whitespace
+# (anything str.isspace() accepts), quotes or angle brackets. Candidates are
+# validated against _TED_URL_RE once trailing punctuation is trimmed
+# (_URL_TRAILING_PUNCTUATION), so a malformed URL is dropped rather than cut
+# short into a different one.
+# Whitespace is spelled out (_URL_WHITESPACE) rather than written \s, whose
+# meaning differs between engines and flags, so RE2's DFA (when installed)
+# matches identically.
+# The pattern ends in a single greedy class with nothing after it to
+# backtrack into, so re's scan stays linear too.
+# A leading \b would defeat re's literal "http" prefix search, and a slug
+# length cap would truncate long slugs into wrong URLs.
+_URL_WHITESPACE = ' \t\n\r\f\v\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_TED_URL_FINDER_PATTERN = (r'https?://(?:www\.)?ted\.com/talks/[^'
+                           + _URL_WHITESPACE + r'<>"\']+')
+_URL_TRAILING_PUNCTUATION = '.,;:!?)]}'
+_TED_URL_FINDER = (re2.compile(_TED_URL_FINDER_PATTERN) if re2 is not None
+                   else re.compile(_TED_URL_FINDER_PATTERN, re.ASCII))
+
+# Audience-reaction markers in transcripts; each one ends a paragraph
+_ARTIFACTS_RE = re.compile(r'\((Laughter|Applause|Music)\)\s*')
+
+# Zero-padded seconds for format_duration()
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+# Characters split at a time by count_words()
+_WORD_COUNT_WINDOW = 1 << 14
+
+# Full names for TED transcript language codes (lowercase keys)
+_LANGUAGE_MAP = {
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'zh': 'Chinese',
+    'ar': 'Arabic',
+    'hi': 'Hindi',
+    'tr': 'Turkish',
+    'nl': 'Dutch',
+    'sv': 'Swedish',
+    'da': 'Danish',
+    'no': 'Norwegian',
+    'fi': 'Finnish',
+    'pl': 'Polish',
+    'cs': 'Czech',
+    'hu': 'Hungarian',
+    'ro': 'Romanian',
+    'bg': 'Bulgarian',
+    'hr': 'Croatian',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'et': 'Estonian',
+    'lv': 'Latvian',
+    'lt': 'Lithuanian',
+    'mt': 'Maltese',
+    'el': 'Greek',
+    'cy': 'Welsh',
+    'ga': 'Irish',
+    'eu': 'Basque',
+    'ca': 'Catalan',
+    'gl': 'Galician',
+    'pt-br': 'Portuguese (Brazilian)',
+    'zh-cn': 'Chinese (Simplified)',
+    'zh-tw': 'Chinese (Traditional)'
+}
+
+
+def validate_ted_url(url: object) -> bool:
     """
     Validate if URL is a valid TED talk URL.
     
@@ -17,24 +101,32 @@ def validate_ted_url(url: str) -> bool:
     Returns:
         True if valid TED URL, False otherwise
     """
-    try:
-        parsed = urlparse(url)
-        
-        # Check domain
-        if parsed.netloc not in ['www.ted.com', 'ted.com']:
-            return False
-        
-        # Check path pattern
-        if not parsed.path.startswith('/talks/'):
-            return False
-        
-        return True
-        
-    except Exception:
+    if not isinstance(url, str) or _TED_TALKS_MARKER not in url:
         return False
+    return _match_ted_url(url)
+
 
+@lru_cache(maxsize=4096)
+def _match_ted_url(url: str) -> bool:
+    """Memoized regex check; URLs are typically validated more than once per run."""
+    return _TED_URL_RE.match(url) is not None
 
-def clean_transcript_text(text: str) -> str:
+
+def validate_ted_urls(urls: Iterable[object]) -> List[bool]:
+    """
+    Validate many URLs at once; same result as calling validate_ted_url() on each.
+    
+    Args:
+        urls: URLs to validate
+        
+    Returns:
+        List of booleans, one per URL, in input order
+    """
+    match = _match_ted_url
+    return [isinstance(url, str) and _TED_TALKS_MARKER in url and match(url) for url in urls]
+
+
+def clean_transcript_text(text: Optional[str]) -> str:
     """
     Clean and normalize transcript text.
     
@@ -47,19 +139,13 @@ def clean_transcript_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Normalize line breaks
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Remove multiple consecutive line breaks
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    # Remove extra whitespace (this also folds every line break, so there
+    # are none left to normalize or collapse afterwards). str.split() splits on
+    # the same Unicode whitespace as \s and drops leading/trailing runs.
+    text = ' '.join(text.split())
     
     # Clean up common transcript artifacts
-    text = re.sub(r'\(Laughter\)\s*', '(Laughter)\n\n', text)
-    text = re.sub(r'\(Applause\)\s*', '(Applause)\n\n', text)
-    text = re.sub(r'\(Music\)\s*', '(Music)\n\n', text)
+    text = _ARTIFACTS_RE.sub(r'(\1)\n\n', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -67,7 +153,7 @@ def clean_transcript_text(text: str) -> str:
     return text
 
 
-def extract_talk_id_from_url(url: str) -> str:
+def extract_talk_id_from_url(url: object) -> str:
     """
     Extract talk ID/slug from TED URL.
     
@@ -75,22 +161,16 @@ def extract_talk_id_from_url(url: str) -> str:
         url: TED talk URL
         
     Returns:
-        Talk ID/slug or empty string if not found
+        Talk ID/slug, or empty string if url is not a valid TED talk URL
     """
-    try:
-        parsed = urlparse(url)
-        path_parts = parsed.path.strip('/').split('/')
-        
-        if len(path_parts) >= 2 and path_parts[0] == 'talks':
-            return path_parts[1]
-        
-        return ""
-        
-    except Exception:
+    if not isinstance(url, str) or _TED_TALKS_MARKER not in url:
         return ""
+    
+    match = _TED_URL_RE.match(url)
+    return match.group(1) if match else ""
 
 
-def get_ted_urls_from_text(text: str) -> List[str]:
+def get_ted_urls_from_text(text: Optional[str]) -> List[str]:
     """
     Extract TED URLs from text using regex.
     
@@ -98,20 +178,17 @@ def get_ted_urls_from_text(text: str) -> List[str]:
         text: Text containing potential TED URLs
         
     Returns:
-        List of valid TED URLs found in text
+        List of unique TED URLs found in text, in order of appearance
     """
-    # Regex pattern for TED URLs
-    pattern = r'https?://(?:www\.)?ted\.com/talks/[^\s<>"\']+'
-    
-    urls = re.findall(pattern, text)
+    if not text or _TED_TALKS_MARKER not in text:
+        return []
     
-    # Validate each URL
-    valid_urls = [url for url in urls if validate_ted_url(url)]
-    
-    return valid_urls
+    candidates = (url.rstrip(_URL_TRAILING_PUNCTUATION) for url in _TED_URL_FINDER.findall(text))
+    return list(dict.fromkeys(url for url in candidates if _match_ted_url(url)))
 
 
-def format_duration(seconds: int) -> str:
+@lru_cache(maxsize=4096)
+def format_duration(seconds: Optional[int]) -> str:
     """
     Format duration in seconds to human-readable format.
     
@@ -124,13 +201,37 @@ def format_duration(seconds: int) -> str:
     if not seconds or seconds < 0:
         return "0:00"
     
-    minutes = seconds // 60
-    remaining_seconds = seconds % 60
+    minutes, remaining_seconds = divmod(seconds, 60)
+    
+    return f"{minutes}:{_TWO_DIGITS[remaining_seconds]}"
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, like ``len(text.split())``.
+    
+    Long texts are split in fixed-size windows so only one window's words
+    are materialized at a time; a word straddling a window edge is counted once.
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Number of words
+    """
+    length = len(text)
+    if length <= _WORD_COUNT_WINDOW:
+        return len(text.split())
     
-    return f"{minutes}:{remaining_seconds:02d}"
+    count = 0
+    for start in range(0, length, _WORD_COUNT_WINDOW):
+        count += len(text[start:start + _WORD_COUNT_WINDOW].split())
+        if start and not text[start - 1].isspace() and not text[start].isspace():
+            count -= 1
+    return count
 
 
-def estimate_reading_time(text: str, words_per_minute: int = 200) -> float:
+def estimate_reading_time(text: Optional[str], words_per_minute: int = 200) -> float:
     """
     Estimate reading time for text.
     
@@ -144,10 +245,10 @@ def estimate_reading_time(text: str, words_per_minute: int = 200) -> float:
     if not text:
         return 0.0
     
-    word_count = len(text.split())
-    return word_count / words_per_minute
+    return count_words(text) / words_per_minute
 
 
+@lru_cache(maxsize=128)
 def get_language_name(language_code: str) -> str:
     """
     Get full language name from language code.
@@ -158,46 +259,4 @@ def get_language_name(language_code: str) -> str:
     Returns:
         Full language name
     """
-    language_map = {
-        'en': 'English',
-        'es': 'Spanish',
-        'fr': 'French',
-        'de': 'German',
-        'it': 'Italian',
-        'pt': 'Portuguese',
-        'ru': 'Russian',
-        'ja': 'Japanese',
-        'ko': 'Korean',
-        'zh': 'Chinese',
-        'ar': 'Arabic',
-        'hi': 'Hindi',
-        'tr': 'Turkish',
-        'nl': 'Dutch',
-        'sv': 'Swedish',
-        'da': 'Danish',
-        'no': 'Norwegian',
-        'fi': 'Finnish',
-        'pl': 'Polish',
-        'cs': 'Czech',
-        'hu': 'Hungarian',
-        'ro': 'Romanian',
-        'bg': 'Bulgarian',
-        'hr': 'Croatian',
-        'sk': 'Slovak',
-        'sl': 'Slovenian',
-        'et': 'Estonian',
-        'lv': 'Latvian',
-        'lt': 'Lithuanian',
-        'mt': 'Maltese',
-        'el': 'Greek',
-        'cy': 'Welsh',
-        'ga': 'Irish',
-        'eu': 'Basque',
-        'ca': 'Catalan',
-        'gl': 'Galician',
-        'pt-br': 'Portuguese (Brazilian)',
-        'zh-cn': 'Chinese (Simplified)',
-        'zh-tw': 'Chinese (Traditional)'
-    }
-    
-    return language_map.get(language_code.lower(), language_code.upper())
+    return _LANGUAGE_MAP.get(language_code.lower(), language_code.upper())